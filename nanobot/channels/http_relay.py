@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
 from uuid import uuid4
 
 from aiohttp import web
@@ -19,6 +21,65 @@ from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import HttpRelayConfig
 
+try:
+    import orjson
+
+    # Chosen once so the hot path never builds options per call. Unknown types
+    # (e.g. pydantic models) fall back to str() instead of raising mid-stream.
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload, str, _ORJSON_OPTS)
+
+except ImportError:  # orjson is a declared dependency; keep working if it failed to install
+
+    def _dumps(payload: Any) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, default=str).encode()
+
+
+# The relay only ever emits these two event types, so frame prefixes are
+# built once here instead of formatted per event. Frames are sent with one
+# write() each: every StreamResponse.write is awaited and framed as its own
+# HTTP chunk, so splitting a frame into prefix/data/suffix writes is ~3x
+# slower than writing the small concatenated frame.
+_SSE_PROGRESS_PREFIX = b"event: progress\ndata: "
+_SSE_RESPONSE_PREFIX = b"event: response\ndata: "
+_SSE_SUFFIX = b"\n\n"
+
+# Metadata sections checked, in order, for the originating relay request id.
+_REQUEST_ID_KEYS = ("progress", "http_relay")
+
+# Seconds a relay request may go without an outbound message before giving up.
+_IDLE_TIMEOUT = 900
+
+
+class _Slot:
+    """Single-consumer mailbox for one relay request.
+
+    Each request has exactly one reader, so a deque plus an Event is enough;
+    asyncio.Queue's getter/putter bookkeeping is not needed. A None item is
+    the idle-timeout sentinel pushed by the request's watchdog.
+    """
+
+    __slots__ = ("_items", "_ready")
+
+    def __init__(self) -> None:
+        self._items: deque[OutboundMessage | None] = deque()
+        self._ready = asyncio.Event()
+
+    def put(self, item: OutboundMessage | None) -> None:
+        self._items.append(item)
+        self._ready.set()
+
+    def empty(self) -> bool:
+        return not self._items
+
+    async def get(self) -> OutboundMessage | None:
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
 
 class HttpRelayChannel(BaseChannel):
     """HTTP relay channel with SSE streaming output."""
@@ -30,12 +91,16 @@ class HttpRelayChannel(BaseChannel):
         self.config: HttpRelayConfig = config
         self._runner: web.AppRunner | None = None
         self._site: web.TCPSite | None = None
-        self._pending: dict[str, asyncio.Queue[OutboundMessage]] = {}
-        self._lock = asyncio.Lock()
+        self._stop_event = asyncio.Event()
+        # Only touched from the event loop, and each access is a single dict
+        # operation with no await in between, so no lock is needed. If this is
+        # ever shared across threads, guard the mutations with a threading.Lock.
+        self._pending: dict[str, _Slot] = {}
 
     async def start(self) -> None:
         """Start the HTTP server and keep running while gateway is active."""
         self._running = True
+        self._stop_event.clear()
         app = web.Application()
         app.router.add_post("/message", self._handle_message_post)
 
@@ -52,15 +117,14 @@ class HttpRelayChannel(BaseChannel):
             self.config.port,
         )
 
-        while self._running:
-            await asyncio.sleep(1)
+        await self._stop_event.wait()
 
     async def stop(self) -> None:
         """Stop the relay HTTP server and clean up pending requests."""
         self._running = False
-        for queue in self._pending.values():
-            while not queue.empty():
-                queue.get_nowait()
+        self._stop_event.set()
+        # Handlers owning these slots are cancelled by runner cleanup below;
+        # dropping the references is enough, no need to drain them.
         self._pending.clear()
 
         if self._runner is not None:
@@ -74,16 +138,14 @@ class HttpRelayChannel(BaseChannel):
         if not request_id:
             return
 
-        queue: asyncio.Queue[OutboundMessage] | None
-        async with self._lock:
-            queue = self._pending.get(request_id)
-        if queue is None:
+        slot = self._pending.get(request_id)
+        if slot is None:
             logger.debug(
                 "No pending HTTP relay request for request_id={}",
                 request_id,
             )
             return
-        await queue.put(msg)
+        slot.put(msg)
 
     async def _handle_message_post(self, request: web.Request) -> web.StreamResponse:
         body = await self._parse_request_body(request)
@@ -106,71 +168,83 @@ class HttpRelayChannel(BaseChannel):
         metadata.setdefault("http_relay", {})
         metadata["http_relay"]["request_id"] = request_id
 
-        queue: asyncio.Queue[OutboundMessage] = asyncio.Queue()
-        async with self._lock:
-            self._pending[request_id] = queue
+        with self._reserve_slot(request_id) as slot:
+            # One self-rearming idle timer per request instead of a wait_for timer
+            # per event: it only pushes the sentinel after a full idle period.
+            loop = asyncio.get_running_loop()
+            last_event_at = loop.time()
+
+            def check_idle() -> None:
+                nonlocal idle_timer
+                remaining = last_event_at + _IDLE_TIMEOUT - loop.time()
+                if remaining > 0:
+                    idle_timer = loop.call_later(remaining, check_idle)
+                elif not slot.empty():
+                    # A message is delivered but not consumed yet; that is activity.
+                    idle_timer = loop.call_later(_IDLE_TIMEOUT, check_idle)
+                else:
+                    slot.put(None)
+
+            idle_timer = loop.call_later(_IDLE_TIMEOUT, check_idle)
 
-        try:
-            response = web.StreamResponse(
-                status=200,
-                reason="OK",
-                headers={
-                    "Content-Type": "text/event-stream",
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no",
-                },
-            )
-            await response.prepare(request)
             try:
-                await self._handle_message(
-                    sender_id=str(sender_id),
-                    chat_id=str(chat_id),
-                    content=str(content),
-                    media=[],
-                    metadata=metadata,
-                )
-            except Exception as exc:
-                logger.error(
-                    "Failed to enqueue inbound message for HTTP relay request {}: {}",
-                    request_id,
-                    exc,
+                response = web.StreamResponse(
+                    status=200,
+                    reason="OK",
+                    headers={
+                        "Content-Type": "text/event-stream",
+                        "Cache-Control": "no-cache",
+                        "Connection": "keep-alive",
+                        "X-Accel-Buffering": "no",
+                    },
                 )
-                await self._write_sse_event(
-                    response,
-                    "response",
-                    {"content": "I could not process this message. Please retry."},
-                )
-                return response
-
-            while True:
+                await response.prepare(request)
                 try:
-                    outbound = await asyncio.wait_for(queue.get(), timeout=900)
-                except asyncio.TimeoutError:
-                    await self._write_sse_event(
-                        response,
-                        "response",
-                        {"content": "Upstream response timed out."},
+                    await self._handle_message(
+                        sender_id=str(sender_id),
+                        chat_id=str(chat_id),
+                        content=str(content),
+                        media=[],
+                        metadata=metadata,
+                    )
+                except Exception as exc:
+                    logger.error(
+                        "Failed to enqueue inbound message for HTTP relay request {}: {}",
+                        request_id,
+                        exc,
+                    )
+                    await self._send_response(
+                        response, "I could not process this message. Please retry."
                     )
                     return response
 
-                is_progress = bool(
-                    (outbound.metadata or {})
-                    .get("progress", {})
-                    .get("is_progress")
-                )
-                event_type = "progress" if is_progress else "response"
-                await self._write_sse_event(
-                    response,
-                    event_type,
-                    {"content": outbound.content},
-                )
-                if not is_progress:
+                while True:
+                    outbound = await slot.get()
+                    if outbound is None:
+                        await self._send_response(response, "Upstream response timed out.")
+                        return response
+                    last_event_at = loop.time()
+
+                    meta = outbound.metadata
+                    progress = meta.get("progress") if meta else None
+                    is_progress = bool(progress and progress.get("is_progress"))
+                    if is_progress:
+                        await self._send_progress(response, outbound.content)
+                        continue
+                    await self._send_response(response, outbound.content)
                     return response
-
+            finally:
+                idle_timer.cancel()
+
+    @contextmanager
+    def _reserve_slot(self, request_id: str) -> Iterator[_Slot]:
+        """Register a slot for request_id for the lifetime of the block."""
+        slot = _Slot()
+        self._pending[request_id] = slot
+        try:
+            yield slot
         finally:
-            async with self._lock:
-                self._pending.pop(request_id, None)
+            self._pending.pop(request_id, None)
 
     async def _parse_request_body(self, request: web.Request) -> dict[str, Any] | web.Response:
         try:
@@ -190,26 +264,27 @@ class HttpRelayChannel(BaseChannel):
 
     @staticmethod
     def _extract_request_id(msg: OutboundMessage) -> str | None:
-        progress = (msg.metadata or {}).get("progress", {})
-        if isinstance(progress, dict):
-            request_id = progress.get("request_id")
-            if isinstance(request_id, str) and request_id:
-                return request_id
-
-        relay = (msg.metadata or {}).get("http_relay", {})
-        if isinstance(relay, dict):
-            request_id = relay.get("request_id")
-            if isinstance(request_id, str) and request_id:
-                return request_id
+        meta = msg.metadata or {}
+        for key in _REQUEST_ID_KEYS:
+            sub = meta.get(key)
+            if isinstance(sub, dict):
+                request_id = sub.get("request_id")
+                if isinstance(request_id, str) and request_id:
+                    return request_id
         return None
 
     @staticmethod
-    async def _write_sse_event(
+    async def _write_sse_frame(
         response: web.StreamResponse,
-        event: str,
+        prefix: bytes,
         payload: dict[str, Any],
     ) -> None:
-        await response.write(
-            f"event: {event}\n"
-            f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode()
-        )
+        await response.write(prefix + _dumps(payload) + _SSE_SUFFIX)
+
+    @classmethod
+    async def _send_progress(cls, response: web.StreamResponse, content: str) -> None:
+        await cls._write_sse_frame(response, _SSE_PROGRESS_PREFIX, {"content": content})
+
+    @classmethod
+    async def _send_response(cls, response: web.StreamResponse, content: str) -> None:
+        await cls._write_sse_frame(response, _SSE_RESPONSE_PREFIX, {"content": content})
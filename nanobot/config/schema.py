@@ -1,7 +1,7 @@
 """Configuration schema using Pydantic."""
 
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from pydantic.alias_generators import to_camel
 from pydantic_settings import BaseSettings
 
@@ -185,23 +185,30 @@ class Config(BaseSettings):
     tools: ToolsConfig = Field(default_factory=ToolsConfig)
     marshal_api_key: str = ""  # Marshal (Praixy) API key for Google/Slack/CRM skills
 
+    _workspace_cache: tuple[str, Path] | None = PrivateAttr(default=None)
+
     @property
     def workspace_path(self) -> Path:
-        """Get expanded workspace path."""
-        return Path(self.agents.defaults.workspace).expanduser()
+        """Get expanded workspace path (recomputed only when the setting changes)."""
+        raw = self.agents.defaults.workspace
+        cached = self._workspace_cache
+        if cached is None or cached[0] != raw:
+            cached = self._workspace_cache = (raw, Path(raw).expanduser())
+        return cached[1]
 
     def _match_provider(self, model: str | None = None) -> tuple["ProviderConfig | None", str | None]:
         """Match provider config and its registry name. Returns (config, spec_name)."""
-        from nanobot.providers.registry import PROVIDERS
+        from nanobot.providers.registry import KEYWORD_INDEX, PROVIDERS
 
         model_lower = (model or self.agents.defaults.model).lower()
 
         # Match by keyword (order follows PROVIDERS registry)
-        for spec in PROVIDERS:
+        for kw, spec in KEYWORD_INDEX:
+            if kw not in model_lower:
+                continue
             p = getattr(self.providers, spec.name, None)
-            if p and any(kw in model_lower for kw in spec.keywords):
-                if spec.is_oauth or p.api_key:
-                    return p, spec.name
+            if p and (spec.is_oauth or p.api_key):
+                return p, spec.name
 
         # Fallback: gateways first, then others (follows registry order)
         # OAuth providers are NOT valid fallbacks — they require explicit model selection
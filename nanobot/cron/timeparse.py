@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 _TZ_ALIASES = {
@@ -22,11 +23,23 @@ _TZ_ALIASES = {
     "PDT": "America/Los_Angeles",
     "PT": "America/Los_Angeles",
 }
+# Common spellings resolve with a single lookup; mixed case falls back to upper().
+_TZ_ALIASES.update({k.lower(): v for k, v in _TZ_ALIASES.items()})
 
 _TIME_ONLY_RE = re.compile(
     r"^\s*(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>[AaPp][Mm])?\s*$"
 )
-_AT_WITH_TZ_SUFFIX_RE = re.compile(r"^\s*(?P<base>.+?)\s+(?P<tz>[A-Za-z]{2,5})\s*$")
+# Single pass over "at": either a bare time or anything else (ISO datetime),
+# each optionally followed by a timezone abbreviation/name suffix.
+_AT_RE = re.compile(
+    r"^\s*(?:(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>[AaPp][Mm])?|(?P<iso>.+?))"
+    r"(?:\s+(?P<tz>[A-Za-z]{2,5}))?\s*$"
+)
+
+
+@lru_cache(maxsize=64)
+def _zi(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
 
 
 def normalize_tz(tz: str | None) -> str | None:
@@ -36,16 +49,20 @@ def normalize_tz(tz: str | None) -> str | None:
     value = tz.strip()
     if not value:
         return None
+    alias = _TZ_ALIASES.get(value)
+    if alias is not None:
+        return alias
     return _TZ_ALIASES.get(value.upper(), value)
 
 
+@lru_cache(maxsize=64)
 def validate_tz(tz: str | None) -> str | None:
     """Validate and return a normalized timezone, or None."""
     normalized = normalize_tz(tz)
     if not normalized:
         return None
     try:
-        ZoneInfo(normalized)
+        _zi(normalized)
     except Exception as e:
         raise ValueError(f"unknown timezone '{tz}'") from e
     return normalized
@@ -55,7 +72,10 @@ def _parse_time_only(value: str) -> tuple[int, int] | None:
     m = _TIME_ONLY_RE.fullmatch(value)
     if not m:
         return None
+    return _time_from_match(m)
 
+
+def _time_from_match(m: re.Match[str]) -> tuple[int, int]:
     hour = int(m.group("hour"))
     minute = int(m.group("minute") or "0")
     ampm = (m.group("ampm") or "").lower()
@@ -91,21 +111,29 @@ def parse_one_time_at(at: str, tz: str | None = None) -> tuple[int, str | None]:
 
     resolved_tz = validate_tz(tz)
 
-    if not resolved_tz:
-        suffix = _AT_WITH_TZ_SUFFIX_RE.fullmatch(text)
-        if suffix:
-            maybe_tz = suffix.group("tz")
+    m = _AT_RE.fullmatch(text)
+    if m and m.group("tz"):
+        if resolved_tz:
+            # An explicit tz wins; the suffix stays part of the text.
+            m = None
+        else:
             try:
-                resolved_tz = validate_tz(maybe_tz)
-                text = suffix.group("base").strip()
+                resolved_tz = validate_tz(m.group("tz"))
             except ValueError:
                 # Keep original text if suffix is not a valid timezone.
-                pass
+                m = None
+
+    if m is None:
+        time_only = _parse_time_only(text)
+    elif m.group("hour") is not None:
+        time_only = _time_from_match(m)
+    else:
+        time_only = None
+        text = m.group("iso")
 
-    time_only = _parse_time_only(text)
     if time_only:
         hour, minute = time_only
-        tzinfo = ZoneInfo(resolved_tz) if resolved_tz else datetime.now().astimezone().tzinfo
+        tzinfo = _zi(resolved_tz) if resolved_tz else datetime.now().astimezone().tzinfo
         if tzinfo is None:
             raise ValueError("failed to determine local timezone")
 
@@ -122,7 +150,7 @@ def parse_one_time_at(at: str, tz: str | None = None) -> tuple[int, str | None]:
         raise ValueError(f"invalid datetime '{at}'") from e
 
     if dt.tzinfo is None and resolved_tz:
-        dt = dt.replace(tzinfo=ZoneInfo(resolved_tz))
+        dt = dt.replace(tzinfo=_zi(resolved_tz))
 
     now_ms = int(datetime.now(dt.tzinfo).timestamp() * 1000) if dt.tzinfo else int(datetime.now().timestamp() * 1000)
     at_ms = int(dt.timestamp() * 1000)
@@ -387,6 +387,16 @@ PROVIDERS: tuple[ProviderSpec, ...] = (
 )
 
 
+# (keyword, spec) pairs flattened in registry order, so model matching is a
+# single pass that still honours PROVIDERS priority. Deliberately not a
+# compiled keyword alternation: a regex returns the leftmost match rather
+# than the highest-priority one, cannot fall through to the next spec when
+# the matched one has no key, and is no faster for the ~30 short keywords.
+KEYWORD_INDEX: tuple[tuple[str, ProviderSpec], ...] = tuple(
+    (kw, spec) for spec in PROVIDERS for kw in spec.keywords
+)
+
+
 # ---------------------------------------------------------------------------
 # Lookup helpers
 # ---------------------------------------------------------------------------
@@ -395,10 +405,10 @@ def find_by_model(model: str) -> ProviderSpec | None:
     """Match a standard provider by model-name keyword (case-insensitive).
     Skips gateways/local — those are matched by api_key/api_base instead."""
     model_lower = model.lower()
-    for spec in PROVIDERS:
+    for kw, spec in KEYWORD_INDEX:
         if spec.is_gateway or spec.is_local:
             continue
-        if any(kw in model_lower for kw in spec.keywords):
+        if kw in model_lower:
             return spec
     return None
 
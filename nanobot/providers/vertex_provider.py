@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import base64
 import uuid
 from typing import Any
 
+import json_repair
 from google import genai
 from google.genai import types
 
@@ -36,6 +38,7 @@ def _openai_messages_to_genai(
     """
     system_parts: list[str] = []
     contents: list[types.Content] = []
+    contents_append = contents.append
 
     for msg in messages:
         role = msg.get("role", "user")
@@ -45,16 +48,26 @@ def _openai_messages_to_genai(
             continue
 
         if role == "assistant":
+            text = msg.get("content")
+            tool_calls = msg.get("tool_calls")
+            if not tool_calls:
+                # Plain text reply — build the Content in one go
+                if text:
+                    contents_append(types.Content(
+                        role="model",
+                        parts=[types.Part.from_text(text=text)],
+                    ))
+                continue
+
             parts: list[types.Part] = []
             # Text content
-            if msg.get("content"):
-                parts.append(types.Part.from_text(text=msg["content"]))
+            if text:
+                parts.append(types.Part.from_text(text=text))
             # Tool calls the model previously made
-            for tc in msg.get("tool_calls", []):
+            for tc in tool_calls:
                 fn = tc.get("function", {})
                 args = fn.get("arguments", {})
                 if isinstance(args, str):
-                    import json_repair
                     args = json_repair.loads(args)
                 meta = tc.get("metadata", {})
                 part = types.Part(function_call=types.FunctionCall(
@@ -68,7 +81,7 @@ def _openai_messages_to_genai(
                     part.thought = meta["thought"]
                 parts.append(part)
             if parts:
-                contents.append(types.Content(role="model", parts=parts))
+                contents_append(types.Content(role="model", parts=parts))
             continue
 
         if role == "tool":
@@ -81,7 +94,7 @@ def _openai_messages_to_genai(
                 # Append to existing function response Content
                 contents[-1].parts.append(part)
             else:
-                contents.append(types.Content(role="user", parts=[part]))
+                contents_append(types.Content(role="user", parts=[part]))
             continue
 
         # user message
@@ -91,14 +104,15 @@ def _openai_messages_to_genai(
             parts = []
             for part in content:
                 if isinstance(part, str):
-                    parts.append(types.Part.from_text(text=part))
+                    if part:
+                        parts.append(types.Part.from_text(text=part))
                 elif isinstance(part, dict):
                     if part.get("type") == "text":
-                        parts.append(types.Part.from_text(text=part.get("text", "")))
+                        if part.get("text"):
+                            parts.append(types.Part.from_text(text=part["text"]))
                     elif part.get("type") == "image_url":
                         url = part.get("image_url", {}).get("url", "")
                         if url.startswith("data:"):
-                            import base64
                             header, b64data = url.split(",", 1)
                             mime = header.split(":")[1].split(";")[0]
                             parts.append(types.Part.from_bytes(
@@ -107,9 +121,14 @@ def _openai_messages_to_genai(
                             ))
                         else:
                             parts.append(types.Part.from_uri(file_uri=url, mime_type="image/jpeg"))
-            contents.append(types.Content(role="user", parts=parts))
+            # Keep the user turn even if every text part was empty, so the
+            # user/model alternation of the history is preserved.
+            contents_append(types.Content(
+                role="user",
+                parts=parts or [types.Part.from_text(text="")],
+            ))
         else:
-            contents.append(types.Content(
+            contents_append(types.Content(
                 role="user",
                 parts=[types.Part.from_text(text=content)],
             ))
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from nanobot.config.schema import Config
+from nanobot.providers.registry import find_by_model
+
+
+def _config(**keys: str) -> Config:
+    config = Config()
+    for name, api_key in keys.items():
+        getattr(config.providers, name).api_key = api_key
+    return config
+
+
+def test_match_provider_by_keyword() -> None:
+    config = _config(anthropic="sk-ant", deepseek="sk-ds")
+
+    assert config.get_provider_name("deepseek/deepseek-chat") == "deepseek"
+    assert config.get_provider_name("anthropic/claude-opus-4-5") == "anthropic"
+    assert config.get_api_key("deepseek-chat") == "sk-ds"
+
+
+def test_match_provider_skips_keyword_match_without_key() -> None:
+    config = _config(openrouter="sk-or")
+
+    # deepseek matches by keyword but has no key, so the gateway fallback wins
+    assert config.get_provider_name("deepseek/deepseek-chat") == "openrouter"
+    assert config.get_api_base("deepseek/deepseek-chat") == "https://openrouter.ai/api/v1"
+
+
+def test_match_provider_oauth_needs_no_key() -> None:
+    config = _config(deepseek="sk-ds")
+
+    assert config.get_provider_name("github_copilot/claude-sonnet") == "github_copilot"
+    # OAuth providers are never used as a fallback
+    assert config.get_provider_name("unknown-model") == "deepseek"
+
+
+def test_match_provider_none_configured() -> None:
+    assert _config().get_provider_name("anthropic/claude-opus-4-5") is None
+
+
+def test_find_by_model_skips_gateways() -> None:
+    assert find_by_model("openrouter/anthropic/claude").name == "anthropic"
+    assert find_by_model("totally-unknown") is None
+
+
+def test_workspace_path_follows_setting() -> None:
+    config = Config()
+    first = config.workspace_path
+
+    assert first == Path("~/.nanobot/workspace").expanduser()
+    assert config.workspace_path is first
+
+    config.agents.defaults.workspace = "/tmp/other-workspace"
+    assert config.workspace_path == Path("/tmp/other-workspace")
+    assert "_workspace_cache" not in config.model_dump()
+
+
+def test_match_provider_sees_provider_changes() -> None:
+    config = _config(deepseek="sk-ds")
+    assert config.get_provider_name("anthropic/claude-opus-4-5") == "deepseek"
+
+    config.providers.anthropic.api_key = "sk-ant"
+    assert config.get_provider_name("anthropic/claude-opus-4-5") == "anthropic"
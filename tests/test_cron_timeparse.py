@@ -0,0 +1,54 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from nanobot.cron.timeparse import parse_one_time_at
+
+
+def test_time_only_schedules_next_occurrence_in_tz() -> None:
+    at_ms, tz = parse_one_time_at("11:30 pm", "America/New_York")
+
+    target = datetime.fromtimestamp(at_ms / 1000, ZoneInfo("America/New_York"))
+    assert tz == "America/New_York"
+    assert (target.hour, target.minute) == (23, 30)
+    assert target > datetime.now(ZoneInfo("America/New_York"))
+
+
+def test_time_only_with_tz_suffix() -> None:
+    at_ms, tz = parse_one_time_at("7am PST")
+
+    target = datetime.fromtimestamp(at_ms / 1000, ZoneInfo("America/Los_Angeles"))
+    assert tz == "America/Los_Angeles"
+    assert (target.hour, target.minute) == (7, 0)
+
+
+def test_iso_with_tz_suffix() -> None:
+    at_ms, tz = parse_one_time_at("2099-02-19T11:00:00 EST")
+
+    expected = datetime(2099, 2, 19, 11, 0, tzinfo=ZoneInfo("America/New_York"))
+    assert tz == "America/New_York"
+    assert at_ms == int(expected.timestamp() * 1000)
+
+
+def test_iso_with_offset_ignores_missing_tz() -> None:
+    at_ms, tz = parse_one_time_at("2099-02-19T11:00:00Z")
+
+    assert tz is None
+    assert at_ms == int(datetime(2099, 2, 19, 11, 0, tzinfo=ZoneInfo("UTC")).timestamp() * 1000)
+
+
+@pytest.mark.parametrize(
+    ("at", "tz", "error"),
+    [
+        ("25:00", None, "invalid hour"),
+        ("11:61", None, "invalid minute"),
+        ("2099-02-19T11:00:00 foo", None, "invalid datetime"),
+        ("2099-02-19T11:00:00 EST", "UTC", "invalid datetime"),
+        ("2000-01-01T00:00:00", None, "must be in the future"),
+        ("11am", "Nowhere/Special", "unknown timezone"),
+    ],
+)
+def test_invalid_inputs(at: str, tz: str | None, error: str) -> None:
+    with pytest.raises(ValueError, match=error):
+        parse_one_time_at(at, tz)
@@ -0,0 +1,169 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from nanobot.bus.events import OutboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.channels.http_relay import HttpRelayChannel, _Slot
+from nanobot.config.schema import HttpRelayConfig
+
+
+class _FakeResponse:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    async def write(self, data: bytes) -> None:
+        self.chunks.append(bytes(data))
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+def _parse_sse(raw: bytes) -> list[tuple[str, dict]]:
+    events = []
+    for frame in raw.decode().split("\n\n"):
+        if not frame:
+            continue
+        event_line, data_line = frame.split("\n")
+        assert event_line.startswith("event: ")
+        assert data_line.startswith("data: ")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_send_helpers_frame_events() -> None:
+    response = _FakeResponse()
+
+    await HttpRelayChannel._send_progress(response, "thinking")
+    await HttpRelayChannel._send_response(response, "héllo ✓")
+
+    assert len(response.chunks) == 2
+    assert response.body.endswith(b"\n\n")
+    assert _parse_sse(response.body) == [
+        ("progress", {"content": "thinking"}),
+        ("response", {"content": "héllo ✓"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_routes_to_pending_request() -> None:
+    channel = HttpRelayChannel(HttpRelayConfig(enabled=True), MessageBus())
+    slot = _Slot()
+    channel._pending["req-1"] = slot
+
+    routed = OutboundMessage(
+        channel="http_relay",
+        chat_id="c1",
+        content="hi",
+        metadata={"http_relay": {"request_id": "req-1"}},
+    )
+    stray = OutboundMessage(
+        channel="http_relay",
+        chat_id="c1",
+        content="lost",
+        metadata={"http_relay": {"request_id": "req-2"}},
+    )
+    await channel.send(routed)
+    await channel.send(stray)
+
+    assert await slot.get() is routed
+    assert slot.empty()
+
+
+async def _post_message(channel: HttpRelayChannel, reply):
+    """POST to the relay handler, run ``reply`` for the inbound message, return SSE events."""
+    app = web.Application()
+    app.router.add_post("/message", channel._handle_message_post)
+
+    async def agent() -> None:
+        inbound = await channel.bus.consume_inbound()
+        await reply(inbound)
+
+    agent_task = asyncio.create_task(agent())
+    async with TestClient(TestServer(app)) as client:
+        resp = await client.post(
+            "/message", json={"senderId": "u1", "chatId": "c1", "content": "hello"}
+        )
+        body = await resp.read()
+    agent_task.cancel()
+    return _parse_sse(body)
+
+
+def _reply_to(inbound, content: str, *, progress: bool = False) -> OutboundMessage:
+    request_id = inbound.metadata["http_relay"]["request_id"]
+    metadata = {"http_relay": {"request_id": request_id}}
+    if progress:
+        metadata["progress"] = {"is_progress": True}
+    return OutboundMessage(
+        channel="http_relay", chat_id=inbound.chat_id, content=content, metadata=metadata
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_post_streams_progress_then_response() -> None:
+    channel = HttpRelayChannel(HttpRelayConfig(enabled=True), MessageBus())
+
+    async def reply(inbound) -> None:
+        await channel.send(_reply_to(inbound, "working", progress=True))
+        await channel.send(_reply_to(inbound, "done"))
+
+    events = await _post_message(channel, reply)
+
+    assert events == [("progress", {"content": "working"}), ("response", {"content": "done"})]
+    assert channel._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_message_post_times_out_when_idle(monkeypatch) -> None:
+    monkeypatch.setattr("nanobot.channels.http_relay._IDLE_TIMEOUT", 0.05)
+    channel = HttpRelayChannel(HttpRelayConfig(enabled=True), MessageBus())
+
+    async def reply(inbound) -> None:
+        await channel.send(_reply_to(inbound, "working", progress=True))
+
+    events = await _post_message(channel, reply)
+
+    assert events == [
+        ("progress", {"content": "working"}),
+        ("response", {"content": "Upstream response timed out."}),
+    ]
+    assert channel._pending == {}
+
+
+def test_extract_request_id_prefers_progress_metadata() -> None:
+    def msg(metadata):
+        return OutboundMessage(channel="http_relay", chat_id="c1", content="x", metadata=metadata)
+
+    assert HttpRelayChannel._extract_request_id(
+        msg({"progress": {"request_id": "p"}, "http_relay": {"request_id": "r"}})
+    ) == "p"
+    assert HttpRelayChannel._extract_request_id(
+        msg({"progress": {"request_id": ""}, "http_relay": {"request_id": "r"}})
+    ) == "r"
+    assert HttpRelayChannel._extract_request_id(msg({"progress": "bogus"})) is None
+    assert HttpRelayChannel._extract_request_id(msg(None)) is None
+
+
+@pytest.mark.asyncio
+async def test_slot_delivers_in_order_and_wakes_reader() -> None:
+    slot = _Slot()
+    first = OutboundMessage(channel="http_relay", chat_id="c1", content="1")
+    second = OutboundMessage(channel="http_relay", chat_id="c1", content="2")
+
+    reader = asyncio.create_task(slot.get())
+    await asyncio.sleep(0)
+    assert not reader.done()
+
+    slot.put(first)
+    slot.put(second)
+    assert await reader is first
+    assert await slot.get() is second
+    assert slot.empty()
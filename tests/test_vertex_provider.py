@@ -0,0 +1,66 @@
+from nanobot.providers.vertex_provider import _openai_messages_to_genai
+
+
+def _summary(contents):
+    return [
+        (c.role, [p.text if p.text is not None else p.function_call.name for p in c.parts])
+        for c in contents
+    ]
+
+
+def test_empty_text_parts_are_skipped_inside_turn() -> None:
+    _, contents = _openai_messages_to_genai([
+        {"role": "user", "content": [
+            {"type": "text", "text": ""},
+            "",
+            {"type": "text", "text": "look"},
+        ]},
+    ])
+
+    assert _summary(contents) == [("user", ["look"])]
+
+
+def test_empty_user_turns_are_kept() -> None:
+    _, contents = _openai_messages_to_genai([
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "yo"},
+        {"role": "user", "content": ""},
+        {"role": "user", "content": [{"type": "text", "text": ""}]},
+    ])
+
+    assert _summary(contents) == [
+        ("user", ["hi"]),
+        ("model", ["yo"]),
+        ("user", [""]),
+        ("user", [""]),
+    ]
+
+
+def test_text_only_assistant_builds_single_part() -> None:
+    system, contents = _openai_messages_to_genai([
+        {"role": "system", "content": "be brief"},
+        {"role": "assistant", "content": "hello"},
+        {"role": "assistant", "content": ""},
+    ])
+
+    assert system == "be brief"
+    assert _summary(contents) == [("model", ["hello"])]
+
+
+def test_assistant_tool_calls_none_is_text_only() -> None:
+    _, contents = _openai_messages_to_genai([
+        {"role": "assistant", "content": "done", "tool_calls": None},
+    ])
+
+    assert _summary(contents) == [("model", ["done"])]
+
+
+def test_assistant_tool_calls_are_converted() -> None:
+    _, contents = _openai_messages_to_genai([
+        {"role": "assistant", "content": "calling", "tool_calls": [
+            {"function": {"name": "read_file", "arguments": '{"path": "a.txt"}'}},
+        ]},
+    ])
+
+    assert _summary(contents) == [("model", ["calling", "read_file"])]
+    assert dict(contents[0].parts[1].function_call.args) == {"path": "a.txt"}